@@ -10,7 +10,7 @@ Version: 2.0
 License: MIT
 
 Usage:
-    python about_comment.py [-h] [-x EXTS] [-v] [-f] path name
+    python about_comment.py [-h] [-x EXTS] [-v] [-f] [-b] [-j JOBS] path name
 
 Arguments:
     path: The path to the file or folder to process
@@ -20,6 +20,8 @@ Options:
     -x EXTS: Only process files with given extension(s) (comma-separated)
     -v: Show verbose output with detailed processing information  
     -f: Force overwrite existing about statements
+    -b: Keep the original of each edited file as <file>.bak
+    -j JOBS: Number of files edited in parallel
 
 Supported Technologies:
     • 50+ Programming Languages (Python, Java, C/C++, Go, Rust, etc.)
@@ -33,19 +35,35 @@ Supported Technologies:
 Features:
     ✓ Cross-platform compatibility (Windows, macOS, Linux)
     ✓ Intelligent comment style detection
-    ✓ Automatic backup creation for large files
+    ✓ Atomic rewrites, with optional backups of the originals
     ✓ Duplicate detection to prevent redundant comments
     ✓ Comprehensive error handling and reporting
     ✓ Preserves file structure (shebangs, doctypes, etc.)
 """
 
+from __future__ import annotations
 
 import pathlib
 import os
 import argparse
+import contextlib
 import re
 import datetime
-from typing import Dict, Tuple, List
+import functools
+import io
+import itertools
+import logging
+import shutil
+import stat
+import sys
+import tempfile
+import threading
+from collections import deque
+
+# typing is only needed by type checkers; annotations are never evaluated at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import BinaryIO, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 # Comprehensive file format support with comment styles
 INCLUDED_EXTS: Dict[str, Tuple[str, str]] = {
@@ -192,6 +210,11 @@ INCLUDED_EXTS: Dict[str, Tuple[str, str]] = {
     "*.readme": ("", ""),
 }
 
+# INCLUDED_EXTS keyed by the plain lowercase suffix (".py"), as returned by os.path.splitext
+COMMENT_STYLES: Dict[str, Tuple[str, str]] = {
+    pattern[1:].lower(): style for pattern, style in INCLUDED_EXTS.items()
+}
+
 EXCLUDED_EXTS = [
     # Binary executables and compiled files
     "exe", "bin", "class", "pyc", "pyo", "pyd", "so", "dll", "dylib", "o", "obj", "a", "lib",
@@ -203,76 +226,199 @@ EXCLUDED_EXTS = [
     "pdf", "doc", "docx", "xls", "xlsx", "ppt", "pptx", 
     "jpg", "jpeg", "png", "gif", "bmp", "tiff", "ico",
     "mp3", "mp4", "avi", "mkv", "wav", "flac", "ogg", "wma", "mov", "wmv", "flv", "webm",
-    
+]
+
+EXCLUDED_DIRS = [
     # Development directories and files
     "node_modules", ".git", ".svn", ".hg", "__pycache__", ".pytest_cache",
     ".vscode", ".idea", ".vs", "dist", "build", "target", "out", ".next", ".nuxt"
 ]
 
-# Global list to store files for processing
-FILES_LIST: List[pathlib.Path] = []
+# Hash sets of the exclusions above, so each check is a single lookup
+EXCLUDED_SUFFIX_SET = frozenset("." + ext for ext in EXCLUDED_EXTS)
+EXCLUDED_DIR_SET = frozenset(EXCLUDED_DIRS)
+
+# Markup declaration after which the about statement is inserted (compiled once)
+DOCTYPE_PATTERN = re.compile(rb'<!DOCTYPE[^>]*>|<\?xml[^>]*\?>', re.IGNORECASE)
+
+# Declarations must open the document, so only this many bytes are searched
+DECLARATION_SCAN_SIZE = 1024
+
+# Leading UTF-8 BOM, shebang and PEP 263 encoding declaration of a Python file, matched in one go
+PYTHON_HEADER_PATTERN = re.compile(rb'(?:\xef\xbb\xbf)?'
+                                   rb'(?P<lines>(?:#![^\n]*(?:\n|\Z))?(?:[ \t\f]*#[^\n]*?coding[:=][^\n]*(?:\n|\Z))?)')
+
+# Bytes read from the top of a file to look for an existing about statement
+HEAD_SIZE = 4096
+
+# Number of leading lines searched for an existing about statement
+ABOUT_SCAN_LINES = 20
+
+# Markers of an existing about statement, besides the upper-cased file name
+ABOUT_INDICATORS = [
+    b"Source Code",
+    b"Author:",
+    b"Created by:",
+    b"Written by:",
+    b"@author",
+    b"* @file",
+    b"* @brief",
+    b"Module:",
+    b"Script:",
+    b"Program:"
+]
+
+# All markers in one pattern, so the head is scanned in a single pass
+ABOUT_PATTERN = re.compile(b"|".join(re.escape(indicator) for indicator in ABOUT_INDICATORS))
 
+# Chunk size used when streaming the rest of a file into its rewritten copy
+COPY_BUFFER_SIZE = 1 << 20
 
-def get_file_creation_time(filepath: pathlib.Path) -> str:
+# Format of the creation date in the about statement
+TIMESTAMP_FORMAT = "%d %B %Y @ %H:%M:%S"
+
+# Stat field used as the creation time, fixed per platform: the birth time
+# where available (macOS), ctime on Windows, modification time elsewhere
+if hasattr(os.stat_result, 'st_birthtime'):
+    CREATION_TIME_FIELD = 'st_birthtime'
+elif os.name == 'nt':
+    CREATION_TIME_FIELD = 'st_ctime'
+else:
+    CREATION_TIME_FIELD = 'st_mtime'
+
+# Files are edited concurrently; the work is dominated by blocking I/O
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Files handled between progress updates when not in verbose mode
+PROGRESS_INTERVAL = 1000
+
+# Console output of the script; see setup_logging()
+logger = logging.getLogger("about_comment")
+
+# Messages a worker thread collects for the file it edits; see grouped_log()
+GROUPED_OUTPUT = threading.local()
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """
+    Logging handler that leaves batching the writes to the stream's buffer.
+    
+    :class:`logging.StreamHandler` flushes after every record, which costs a
+    write per message. Here the buffer is only written out by :meth:`flush`,
+    on progress updates and when logging shuts down.
+    """
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            message = self.format(record)
+            grouped = getattr(GROUPED_OUTPUT, "messages", None)
+            if grouped is not None:
+                grouped.append(message)
+                return
+            self.stream.write(message + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging() -> None:
+    """Send the script's messages to a block-buffered standard output."""
+    try:
+        stream = open(sys.stdout.fileno(), "w", buffering=io.DEFAULT_BUFFER_SIZE,
+                      encoding=sys.stdout.encoding, errors="backslashreplace", closefd=False)
+    except (AttributeError, OSError, ValueError):
+        # No real file behind stdout (e.g. when captured); use it as it is
+        stream = sys.stdout
+    
+    handler = BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+@contextlib.contextmanager
+def grouped_log() -> Iterator[None]:
+    """
+    Collect the messages this thread logs and write them out as one record.
+    
+    Files are edited in parallel, so this keeps each file's messages together.
+    """
+    GROUPED_OUTPUT.messages = messages = []
+    try:
+        yield
+    finally:
+        GROUPED_OUTPUT.messages = None
+        if messages:
+            logger.info("\n".join(messages))
+
+
+def flush_log() -> None:
+    """Write out the messages buffered so far."""
+    for handler in logger.handlers:
+        handler.flush()
+
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(timestamp: int) -> str:
+    """
+    Format a timestamp, in whole seconds, for the about statement.
+    
+    Files of one batch often share the same second, so results are cached.
+    
+    :param timestamp: Seconds since the epoch
+    :type timestamp: int
+    :return: Formatted date and time string
+    :rtype: str
+    """
+    return datetime.datetime.fromtimestamp(timestamp).strftime(TIMESTAMP_FORMAT)
+
+
+def get_file_creation_time(filepath: pathlib.Path, stat_info: Optional[os.stat_result] = None) -> str:
     """
     Get the file creation/modification time in a cross-platform way.
     
     :param filepath: Path to the file
     :type filepath: pathlib.Path
+    :param stat_info: Already fetched stat result for the file, defaults to None
+    :type stat_info: os.stat_result, optional
     :return: Formatted date and time string
     :rtype: str
     """
     try:
-        # Get file stats
-        stat_info = filepath.stat()
+        # Get file stats, reusing the caller's if it already has them
+        if stat_info is None:
+            stat_info = filepath.stat()
         
-        # Use creation time if available (Windows), otherwise use modification time
-        if hasattr(stat_info, 'st_birthtime'):  # macOS
-            timestamp = stat_info.st_birthtime
-        elif hasattr(stat_info, 'st_ctime') and os.name == 'nt':  # Windows
-            timestamp = stat_info.st_ctime
-        else:  # Linux and others - use modification time
-            timestamp = stat_info.st_mtime
-            
-        # Convert to readable format
-        dt = datetime.datetime.fromtimestamp(timestamp)
-        return dt.strftime("%d %B %Y @ %H:%M:%S")
+        # Convert the platform's creation time to readable format
+        return format_timestamp(int(getattr(stat_info, CREATION_TIME_FIELD)))
     except Exception:
         # Fallback to current time
-        return datetime.datetime.now().strftime("%d %B %Y @ %H:%M:%S")
+        return datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
 
 
-def is_excluded_path(path: pathlib.Path) -> bool:
+def accepted_suffixes(exts: List[str]) -> FrozenSet[str]:
     """
-    Check if a path should be excluded from processing.
+    Resolve extension filters to the lowercase suffixes that will be processed.
     
-    :param path: Path to check
-    :type path: pathlib.Path
-    :return: True if path should be excluded
-    :rtype: bool
-    """
-    path_str = str(path).lower()
-    path_parts = path.parts
+    Filters may be given as "py", ".py" or "*.py"; "*" selects every supported
+    format. Unsupported and excluded extensions are left out.
     
-    # Check if any part of the path contains excluded directories/files
-    for part in path_parts:
-        part_lower = part.lower()
-        for excluded in EXCLUDED_EXTS:
-            if excluded == part_lower or (excluded in part_lower and len(excluded) > 3):
-                return True
-                
-    # Also check the filename itself
-    filename = path.name.lower()
-    for excluded in EXCLUDED_EXTS:
-        if filename.endswith('.' + excluded) or filename == excluded:
-            return True
-            
-    return False
+    :param exts: The extensions of files to include
+    :type exts: List[str]
+    :return: Lowercase suffixes such as ".py"
+    :rtype: FrozenSet[str]
+    """
+    if "*" in exts:
+        accepted = frozenset(COMMENT_STYLES)
+    else:
+        wanted = {"." + ext.lower().rpartition(".")[2].lstrip("*") for ext in exts}
+        accepted = frozenset(COMMENT_STYLES).intersection(wanted)
+    return accepted - EXCLUDED_SUFFIX_SET
 
 
-def get_folder(foldername: str, exts: List[str] = ["*"], verbose: bool = False) -> None:
+def get_folder(foldername: str, exts: List[str] = ["*"], verbose: bool = False) -> Iterator[os.DirEntry]:
     """
-    Recursively gets all the files in the specified folder with the given extensions.
+    Recursively yields all the supported files in the specified folder with the given extensions.
 
     :param foldername: The folder name
     :type foldername: str
@@ -280,124 +426,272 @@ def get_folder(foldername: str, exts: List[str] = ["*"], verbose: bool = False)
     :type exts: List[str], optional
     :param verbose: Flag to print verbose output, defaults to False
     :type verbose: bool, optional
+    :return: Generator of the directory entries of the matching files, in walk order
+    :rtype: Iterator[os.DirEntry]
     """
     folder_path = pathlib.Path(foldername)
     
     if not folder_path.exists():
-        print(f"[!] Folder '{foldername}' does not exist.")
+        logger.error(f"[!] Folder '{foldername}' does not exist.")
         return
         
     if not folder_path.is_dir():
-        print(f"[!] '{foldername}' is not a directory.")
+        logger.error(f"[!] '{foldername}' is not a directory.")
         return
     
-    for ext in exts:
-        # Handle extensions that don't start with *
-        if not ext.startswith("*"):
-            if not ext.startswith("."):
-                pattern = "*." + ext
-            else:
-                pattern = "*" + ext
-        else:
-            pattern = ext
-                
+    # Combine the extension filters, the supported formats and the excluded
+    # extensions into one set of lowercase suffixes, so each file costs a single lookup
+    accepted = accepted_suffixes(exts)
+    if not accepted:
+        return
+    
+    # Iterative walk - each directory is scanned exactly once
+    stack = deque([str(folder_path)])
+    while stack:
+        directory = stack.pop()
         try:
-            for child in folder_path.rglob(pattern):
-                if child.is_file() and not is_excluded_path(child):
-                    if child not in FILES_LIST:
-                        FILES_LIST.append(child)
-                        if verbose:
-                            print(f"[*] Added {child} to processing list")
-        except Exception as e:
+            # Read the whole directory before yielding, so files written by
+            # the consumer meanwhile (e.g. backups) are not picked up
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
             if verbose:
-                print(f"[!] Error processing pattern '{pattern}': {e}")
+                logger.error(f"[!] Error scanning directory '{directory}': {e}")
+            continue
+        
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # Excluded directories are pruned here and never scanned
+                if entry.name.lower() not in EXCLUDED_DIR_SET:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                # Unsupported and excluded formats are dropped here rather than failing later
+                if os.path.splitext(entry.name)[1].lower() not in accepted:
+                    continue
+                # A single walk that never follows symlinks cannot
+                # yield the same path twice, so no de-dup is needed
+                if verbose:
+                    logger.info(f"[*] Found {entry.path}")
+                # The entry carries the file type (and on Windows the
+                # stat result) from the directory listing for reuse
+                yield entry
 
 
-def has_about_statement(content: str, filename: str) -> bool:
+def has_about_statement(content: bytes, filename: str) -> bool:
     """
     Check if the file already has an about statement.
     
-    :param content: File content to check
-    :type content: str
+    The check works on the raw bytes, so the content never has to be decoded.
+    
+    :param content: Raw file content to check, usually just its head
+    :type content: bytes
     :param filename: Name of the file
     :type filename: str
     :return: True if about statement exists
     :rtype: bool
     """
-    # Look for various indicators of existing about statements
-    indicators = [
-        filename.upper(),
-        "Source Code",
-        "Author:",
-        "Created by:",
-        "Written by:",
-        "@author",
-        "* @file",
-        "* @brief",
-        "Module:",
-        "Script:",
-        "Program:"
-    ]
+    # Find the end of the first lines without splitting the content
+    end = -1
+    for _ in range(ABOUT_SCAN_LINES):
+        end = content.find(b'\n', end + 1)
+        if end == -1:
+            end = len(content)
+            break
     
-    # Check first 20 lines for about statements
-    lines = content.split('\n')[:20]
-    first_lines = '\n'.join(lines)
-    
-    return any(indicator in first_lines for indicator in indicators)
+    # Look for various indicators of existing about statements
+    return (ABOUT_PATTERN.search(content, 0, end) is not None
+            or content.find(filename.upper().encode("utf-8"), 0, end) != -1)
 
 
-def perm_edit(name: str, force: bool = False, verbose: bool = False) -> None:
+def perm_edit(files: Iterable[os.DirEntry], name: str, force: bool = False, verbose: bool = False,
+              backup: bool = False, jobs: int = MAX_WORKERS) -> int:
     """
-    Applies the about statement to all the files in the files_list.
+    Applies the about statement to all the given files.
 
+    Files are processed as they are produced, so passing the
+    :func:`get_folder` generator starts editing before the walk finishes.
+
+    :param files: Directory entries of the files to edit, e.g. the result of get_folder()
+    :type files: Iterable[os.DirEntry]
     :param name: The name to be set as the author of the file
     :type name: str
     :param force: Force overwrite existing about statements
     :type force: bool
     :param verbose: Flag to print verbose output, defaults to False
     :type verbose: bool, optional
+    :param backup: Keep the original of each edited file as ``<file>.bak``, defaults to False
+    :type backup: bool, optional
+    :param jobs: Number of files edited in parallel, defaults to MAX_WORKERS
+    :type jobs: int, optional
+    :return: Number of files handled (processed, skipped or failed)
+    :rtype: int
     """
-    if not FILES_LIST:
-        print("[!] No files found to process.")
-        return
-        
-    print(f"[*] Processing {len(FILES_LIST)} files...")
+    def process_file(entry: os.DirEntry) -> str:
+        file_path = entry.path
+        # Each file's verbose output is written in one piece, not interleaved with other workers
+        with grouped_log():
+            if verbose:
+                logger.info(f"\n{'=' * 75}\nProcessing: {file_path}\n{'=' * 75}")
+            try:
+                return edit_file(pathlib.Path(file_path), name, force, verbose, entry.stat(), backup)
+            except Exception as e:
+                # The walk only yields supported formats, so this is a genuine failure
+                if verbose:
+                    logger.error(f"[!] Error processing '{file_path}': {e}")
+                return "error"
+    
+    logger.info("[*] Processing files...")
+    flush_log()
     processed = 0
     skipped = 0
     errors = 0
     
-    for file_path in FILES_LIST:
-        if file_path.is_file():
-            if verbose:
-                print(f"\n{'=' * 75}")
-                print(f"Processing: {file_path}")
-                print(f"{'=' * 75}")
-            try:
-                result = edit_file(file_path, name, force, verbose)
+    # Imported here, as single-file runs never need a thread pool
+    import concurrent.futures
+    
+    # Each file is independent and I/O-bound, so threads overlap the disk waits.
+    # Only a bounded window of files is in flight, so the walk advances along
+    # with the edits instead of being drained into the pool up front
+    files = iter(files)
+    pending = set()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+        while True:
+            for entry in itertools.islice(files, jobs * 2 - len(pending)):
+                pending.add(executor.submit(process_file, entry))
+            if not pending:
+                break
+            
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
                 if result == "processed":
                     processed += 1
                 elif result == "skipped":
                     skipped += 1
                 else:
                     errors += 1
-            except Exception as e:
-                errors += 1
-                ext = "*" + file_path.suffix
-                if verbose:
-                    print(f"[!] Error processing '{file_path}': {e}")
-                elif ext not in INCLUDED_EXTS:
-                    print(f"[!] Unsupported file format '{ext}' for file: {file_path}")
+                
+                # Progress instead of a line per file keeps the output small on large trees
+                handled = processed + skipped + errors
+                if not verbose and handled % PROGRESS_INTERVAL == 0:
+                    logger.info(f"[*] {handled} files handled...")
+                    flush_log()
+    
+    total = processed + skipped + errors
+    if not total:
+        return 0
+    
+    # Summary, written in one call
+    logger.info(f"\n{'=' * 50}\n"
+                f"Processing Complete!\n"
+                f"Processed: {processed} files\n"
+                f"Skipped: {skipped} files\n"
+                f"Errors: {errors} files\n"
+                f"{'=' * 50}")
+    flush_log()
     
-    # Summary
-    print(f"\n{'=' * 50}")
-    print(f"Processing Complete!")
-    print(f"Processed: {processed} files")
-    print(f"Skipped: {skipped} files") 
-    print(f"Errors: {errors} files")
-    print(f"{'=' * 50}")
+    return total
+
+
+# Human readable file type per extension; anything else is plain "Source Code"
+FILE_DESCRIPTIONS: Dict[str, str] = {
+    '.py': 'Python Script',
+    '.java': 'Java Source Code',
+    '.c': 'C Source Code',
+    '.cpp': 'C++ Source Code',
+    '.h': 'Header File',
+    '.js': 'JavaScript Source Code',
+    '.ts': 'TypeScript Source Code',
+    '.html': 'HTML Document',
+    '.css': 'CSS Stylesheet',
+    '.php': 'PHP Source Code',
+    '.rb': 'Ruby Script',
+    '.go': 'Go Source Code',
+    '.rs': 'Rust Source Code',
+    '.swift': 'Swift Source Code',
+    '.kt': 'Kotlin Source Code',
+    '.scala': 'Scala Source Code',
+    '.sh': 'Shell Script',
+    '.ps1': 'PowerShell Script',
+    '.sql': 'SQL Script',
+    '.r': 'R Script',
+    '.m': 'MATLAB Script',
+    '.lua': 'Lua Script',
+    '.pl': 'Perl Script',
+    '.yaml': 'YAML Configuration',
+    '.yml': 'YAML Configuration',
+    '.json': 'JSON Data',
+    '.xml': 'XML Document',
+    '.md': 'Markdown Document',
+    '.tex': 'LaTeX Document',
+    '.dockerfile': 'Docker Configuration'
+}
+
+
+def build_about_template(suffix: str, comment_style: Tuple[str, str]) -> str:
+    """
+    Build the about statement template for a file type.
+    
+    The comment markers and file type description are baked in; the
+    ``{filename}``, ``{name}`` and ``{created}`` fields are filled in by
+    :func:`author_template` and :func:`generate_about_statement`.
+    
+    :param suffix: Lowercase file extension, e.g. ".py"
+    :type suffix: str
+    :param comment_style: Tuple of (start_comment, end_comment)
+    :type comment_style: Tuple[str, str]
+    :return: The format template
+    :rtype: str
+    """
+    start_comment, end_comment = comment_style
+    description = FILE_DESCRIPTIONS.get(suffix, 'Source Code')
+    
+    if end_comment:  # Multi-line comment style
+        if suffix in {'.py', '.html', '.xml', '.svg', '.vue'}:
+            # Python triple quotes and XML-style comments
+            return (start_comment + '\n{filename} - ' + description + '\nAuthor: {name}\nCreated: {created}\n'
+                    + end_comment + '\n\n')
+        # C-style comments
+        return (start_comment + '\n * {filename} - ' + description + '\n * Author: {name}\n * Created: {created}\n '
+                + end_comment + '\n\n')
+    
+    # Single-line comment style (hash, R, SQL, ...)
+    return (start_comment + '{filename} - ' + description + '\n'
+            + start_comment + 'Author: {name}\n'
+            + start_comment + 'Created: {created}\n\n')
+
+
+# About statement templates for every supported extension, built once
+ABOUT_TEMPLATES: Dict[str, str] = {
+    suffix: build_about_template(suffix, style) for suffix, style in COMMENT_STYLES.items()
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def author_template(template: str, name: str) -> Tuple[bytes, bytes, bytes]:
+    """
+    Fill in the author and encode an about statement template.
+    
+    The author is the same for a whole run, so this happens once per file
+    type. The template is split around the per-file ``{filename}`` and
+    ``{created}`` fields, which are joined in between.
+    
+    :param template: Template from :func:`build_about_template`
+    :type template: str
+    :param name: Author name
+    :type name: str
+    :return: The encoded text before the file name, between it and the date, and after the date
+    :rtype: Tuple[bytes, bytes, bytes]
+    """
+    before, _, rest = template.partition('{filename}')
+    between, _, after = rest.partition('{created}')
+    return (before.replace('{name}', name).encode("utf-8"),
+            between.replace('{name}', name).encode("utf-8"),
+            after.replace('{name}', name).encode("utf-8"))
 
 
-def generate_about_statement(filepath: pathlib.Path, name: str, comment_style: Tuple[str, str]) -> str:
+def generate_about_statement(filepath: pathlib.Path, name: str, comment_style: Tuple[str, str],
+                             stat_info: Optional[os.stat_result] = None) -> bytes:
     """
     Generate the about statement for a file.
     
@@ -407,70 +701,226 @@ def generate_about_statement(filepath: pathlib.Path, name: str, comment_style: T
     :type name: str
     :param comment_style: Tuple of (start_comment, end_comment)
     :type comment_style: Tuple[str, str]
-    :return: Generated about statement
-    :rtype: str
+    :param stat_info: Already fetched stat result for the file, defaults to None
+    :type stat_info: os.stat_result, optional
+    :return: Generated about statement, encoded as UTF-8
+    :rtype: bytes
     """
     filename = filepath.name.upper()
-    creation_time = get_file_creation_time(filepath)
-    start_comment, end_comment = comment_style
+    creation_time = get_file_creation_time(filepath, stat_info)
     
-    # Determine file type description
+    # The layout, description and author are precomputed; only the file name and date vary
     ext = filepath.suffix.lower()
-    file_type_map = {
-        '.py': 'Python Script',
-        '.java': 'Java Source Code',
-        '.c': 'C Source Code',
-        '.cpp': 'C++ Source Code',
-        '.h': 'Header File',
-        '.js': 'JavaScript Source Code',
-        '.ts': 'TypeScript Source Code',
-        '.html': 'HTML Document',
-        '.css': 'CSS Stylesheet',
-        '.php': 'PHP Source Code',
-        '.rb': 'Ruby Script',
-        '.go': 'Go Source Code',
-        '.rs': 'Rust Source Code',
-        '.swift': 'Swift Source Code',
-        '.kt': 'Kotlin Source Code',
-        '.scala': 'Scala Source Code',
-        '.sh': 'Shell Script',
-        '.ps1': 'PowerShell Script',
-        '.sql': 'SQL Script',
-        '.r': 'R Script',
-        '.m': 'MATLAB Script',
-        '.lua': 'Lua Script',
-        '.pl': 'Perl Script',
-        '.yaml': 'YAML Configuration',
-        '.yml': 'YAML Configuration',
-        '.json': 'JSON Data',
-        '.xml': 'XML Document',
-        '.md': 'Markdown Document',
-        '.tex': 'LaTeX Document',
-        '.dockerfile': 'Docker Configuration'
-    }
-    
-    file_description = file_type_map.get(ext, 'Source Code')
+    template = ABOUT_TEMPLATES.get(ext)
+    if template is None or COMMENT_STYLES[ext] != comment_style:
+        template = build_about_template(ext, comment_style)
     
-    if end_comment:  # Multi-line comment style
-        if ext == '.py':
-            # Python uses triple quotes
-            return f'{start_comment}\n{filename} - {file_description}\nAuthor: {name}\nCreated: {creation_time}\n{end_comment}\n\n'
-        elif ext in ['.html', '.xml', '.svg', '.vue']:
-            # XML-style comments
-            return f'{start_comment}\n{filename} - {file_description}\nAuthor: {name}\nCreated: {creation_time}\n{end_comment}\n\n'
-        else:
-            # C-style comments
-            return f'{start_comment}\n * {filename} - {file_description}\n * Author: {name}\n * Created: {creation_time}\n {end_comment}\n\n'
-    else:  # Single-line comment style
-        if ext in ['.r', '.R']:
-            # R-style comments
-            return f'{start_comment}{filename} - {file_description}\n{start_comment}Author: {name}\n{start_comment}Created: {creation_time}\n\n'
-        else:
-            # Hash-style or other single-line comments
-            return f'{start_comment}{filename} - {file_description}\n{start_comment}Author: {name}\n{start_comment}Created: {creation_time}\n\n'
+    before, between, after = author_template(template, name)
+    return b"".join((before, filename.encode("utf-8"), between, creation_time.encode("utf-8"), after))
+
+
+def insert_after_php_tag(content: bytes, about_statement: bytes, newline: bytes) -> bytes:
+    """
+    Insert the about statement after a bare PHP opening tag line.
+    
+    :param content: Content of the top of the file
+    :type content: bytes
+    :param about_statement: The about statement to insert
+    :type about_statement: bytes
+    :param newline: Line ending of the file, b"\\n" or b"\\r\\n"
+    :type newline: bytes
+    :return: The content with the about statement inserted
+    :rtype: bytes
+    """
+    if content.startswith(b"<?php"):
+        first_line, _, rest = content.partition(b'\n')
+        if first_line.strip() == b"<?php":
+            return first_line + b'\n' + newline + about_statement + rest
+        return about_statement + content
+    return b"<?php" + newline + newline + about_statement + content
+
+
+def insert_after_declaration(content: bytes, about_statement: bytes, newline: bytes) -> bytes:
+    """
+    Insert the about statement after a DOCTYPE/XML declaration, if any.
+    
+    :param content: Content of the top of the file
+    :type content: bytes
+    :param about_statement: The about statement to insert
+    :type about_statement: bytes
+    :param newline: Line ending of the file, b"\\n" or b"\\r\\n"
+    :type newline: bytes
+    :return: The content with the about statement inserted
+    :rtype: bytes
+    """
+    doctype_match = DOCTYPE_PATTERN.search(content, 0, DECLARATION_SCAN_SIZE)
+    if doctype_match:
+        insert_pos = doctype_match.end()
+        return content[:insert_pos] + newline + newline + about_statement + content[insert_pos:]
+    return about_statement + content
+
+
+def insert_after_python_header(content: bytes, about_statement: bytes, newline: bytes) -> bytes:
+    """
+    Insert the about statement after a BOM, shebang and encoding declaration, if any.
+    
+    :param content: Content of the top of the file
+    :type content: bytes
+    :param about_statement: The about statement to insert
+    :type about_statement: bytes
+    :param newline: Line ending of the file, b"\\n" or b"\\r\\n"
+    :type newline: bytes
+    :return: The content with the about statement inserted
+    :rtype: bytes
+    """
+    # Skip BOM, shebang and encoding declaration
+    header_match = PYTHON_HEADER_PATTERN.match(content)
+    header, rest = content[:header_match.end()], content[header_match.end():]
+    
+    # The head passed in always ends on a line boundary, so a header line
+    # without a newline can only be the last line of the file
+    if not rest and header_match.group("lines") and not header.endswith(b'\n'):
+        return header + newline + about_statement
+    return header + about_statement + newline + rest
 
 
-def edit_file(filepath: pathlib.Path, name: str, force: bool = False, verbose: bool = False) -> str:
+def prepend_about_statement(content: bytes, about_statement: bytes, newline: bytes) -> bytes:
+    """
+    Insert the about statement at the very beginning of the content.
+    
+    :param content: Content of the top of the file
+    :type content: bytes
+    :param about_statement: The about statement to insert
+    :type about_statement: bytes
+    :param newline: Line ending of the file, b"\\n" or b"\\r\\n"
+    :type newline: bytes
+    :return: The content with the about statement inserted
+    :rtype: bytes
+    """
+    return about_statement + content
+
+
+# Placement of the about statement by file suffix; anything else is prepended
+ABOUT_INSERTERS: Dict[str, Callable[[bytes, bytes, bytes], bytes]] = {
+    ".php": insert_after_php_tag,
+    ".html": insert_after_declaration,
+    ".htm": insert_after_declaration,
+    ".xml": insert_after_declaration,
+    ".svg": insert_after_declaration,
+    ".py": insert_after_python_header,
+}
+
+
+def insert_about_statement(content: bytes, about_statement: bytes, newline: bytes, suffix: str) -> bytes:
+    """
+    Insert the about statement into the given file content.
+    
+    Shebangs, encoding declarations, PHP opening tags and markup
+    declarations are kept ahead of the statement. The content itself is
+    left as it is; the statement must already use the file's line endings.
+    
+    :param content: Content of the top of the file
+    :type content: bytes
+    :param about_statement: The about statement to insert
+    :type about_statement: bytes
+    :param suffix: Lowercase file extension, e.g. ".py"
+    :type suffix: str
+    :return: The content with the about statement inserted
+    :rtype: bytes
+    """
+    return ABOUT_INSERTERS.get(suffix, prepend_about_statement)(content, about_statement, newline)
+
+
+def write_temp_file_with_head(filepath: pathlib.Path, head: bytes, src: BinaryIO) -> pathlib.Path:
+    """
+    Write the given head followed by the unread rest of ``src`` to a temporary file.
+    
+    The temporary file is created next to the original, so that
+    :func:`replace_file` can swap it in atomically once ``src`` is closed.
+    
+    :param filepath: The path of the file being rewritten
+    :type filepath: pathlib.Path
+    :param head: New content for the top of the file
+    :type head: bytes
+    :param src: Open binary handle of the file, positioned after the old head
+    :type src: BinaryIO
+    :return: The path of the temporary file
+    :rtype: pathlib.Path
+    """
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    
+    # A uniquely named temp file never clobbers a neighbour or a parallel run
+    dst = tempfile.NamedTemporaryFile(dir=filepath.parent, prefix='.' + filepath.name + '.',
+                                      suffix='.tmp', delete=False)
+    tmp_path = pathlib.Path(dst.name)
+    
+    try:
+        with dst:
+            dst.write(head)
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return tmp_path
+
+
+def replace_file(tmp_path: pathlib.Path, filepath: pathlib.Path, stat_info: os.stat_result) -> None:
+    """
+    Atomically replace a file with its rewritten temporary copy.
+    
+    The copy gets the permissions of the original and, where allowed, its
+    owner and group, so the file is never half written or given away.
+    The original must be closed first, as Windows cannot replace open files.
+    
+    :param tmp_path: The path of the rewritten copy
+    :type tmp_path: pathlib.Path
+    :param filepath: The path of the file to replace
+    :type filepath: pathlib.Path
+    :param stat_info: Stat result of the original file
+    :type stat_info: os.stat_result
+    """
+    try:
+        os.chmod(tmp_path, stat.S_IMODE(stat_info.st_mode))
+        if hasattr(os, "chown"):
+            try:
+                os.chown(tmp_path, stat_info.st_uid, stat_info.st_gid)
+            except OSError:
+                # Only root may change the owner; members can still keep the group
+                try:
+                    os.chown(tmp_path, -1, stat_info.st_gid)
+                except OSError:
+                    pass
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def backup_file(filepath: pathlib.Path) -> pathlib.Path:
+    """
+    Keep the current content of a file as ``<file>.bak``.
+    
+    The backup is a hard link where the file system allows it. The rewrite
+    replaces the file with a new inode, so the link keeps the original
+    without copying it; otherwise the file is copied.
+    
+    :param filepath: The path of the file to back up
+    :type filepath: pathlib.Path
+    :return: The path of the backup
+    :rtype: pathlib.Path
+    """
+    backup_path = filepath.with_name(filepath.name + '.bak')
+    backup_path.unlink(missing_ok=True)
+    try:
+        os.link(filepath, backup_path)
+    except OSError:
+        shutil.copyfile(filepath, backup_path)
+    return backup_path
+
+
+def edit_file(filepath: pathlib.Path, name: str, force: bool = False, verbose: bool = False,
+              stat_info: Optional[os.stat_result] = None, backup: bool = False) -> str:
     """
     Edits the specified file to add the about statement.
 
@@ -482,127 +932,118 @@ def edit_file(filepath: pathlib.Path, name: str, force: bool = False, verbose: b
     :type force: bool
     :param verbose: Flag to print verbose output, defaults to False
     :type verbose: bool, optional
+    :param stat_info: Already fetched stat result for the file, defaults to None
+    :type stat_info: os.stat_result, optional
+    :param backup: Keep the original file as ``<file>.bak``, defaults to False
+    :type backup: bool, optional
     :return: Status of the operation ("processed", "skipped", "error")
     :rtype: str
     """
     try:
-        # Check if file exists and is readable
-        if not filepath.exists():
-            if verbose:
-                print(f"[!] File does not exist: {filepath}")
-            return "error"
-            
-        if not filepath.is_file():
-            if verbose:
-                print(f"[!] Path is not a file: {filepath}")
-            return "error"
-            
-        # Get file extension
-        ext = "*" + filepath.suffix.lower()
+        # Derive the file name and extension once and reuse them below
+        filename = filepath.name
+        suffix = os.path.splitext(filename)[1].lower()
+        comment_style = COMMENT_STYLES.get(suffix)
         
-        if ext not in INCLUDED_EXTS:
+        # Reject unsupported formats before touching the file system
+        if comment_style is None:
             if verbose:
-                print(f"[!] Unsupported file format '{ext}' for file: {filepath}")
+                logger.error(f"[!] Unsupported file format '*{suffix}' for file: {filepath}")
             return "error"
         
-        # Read file content
+        # Check if file exists and is a regular file; entries from the walk
+        # come with their stat result, otherwise a single stat() answers both
+        if stat_info is None:
+            try:
+                stat_info = filepath.stat()
+            except FileNotFoundError:
+                if verbose:
+                    logger.error(f"[!] File does not exist: {filepath}")
+                return "error"
+            
+            if not stat.S_ISREG(stat_info.st_mode):
+                if verbose:
+                    logger.error(f"[!] Path is not a file: {filepath}")
+                return "error"
+            
+        # Open the file once: the head is checked for an existing about
+        # statement and the remainder is streamed into the rewritten file
         try:
-            with open(filepath, "r", encoding="utf-8", errors="ignore") as file:
-                content = file.read()
+            src = open(filepath, "rb")
         except Exception as e:
             if verbose:
-                print(f"[!] Error reading file '{filepath}': {e}")
+                logger.error(f"[!] Error reading file '{filepath}': {e}")
             return "error"
-            
-        if verbose:
-            print(f"[*] Reading content of '{filepath}'")
         
-        # Check if about statement already exists
-        if has_about_statement(content, filepath.name) and not force:
+        with src:
+            head = src.read(HEAD_SIZE)
+            
+            # Finish the line the head stops in, so the end of the head is
+            # always a line boundary or the end of the file, never mid-line
+            if len(head) == HEAD_SIZE and not head.endswith(b'\n'):
+                head += src.readline()
+            
             if verbose:
-                print(f"[!] About statement already exists in '{filepath}' (use -f to force overwrite)")
-            else:
-                print(f"[!] Already processed: {filepath}")
-            return "skipped"
-        
-        # Generate about statement
-        comment_style = INCLUDED_EXTS[ext]
-        about_statement = generate_about_statement(filepath, name, comment_style)
-        
-        # Handle special cases for certain file types
-        new_content = content
-        
-        if ext == "*.php":
-            # Handle PHP files
-            if content.startswith("<?php"):
-                # Insert after PHP opening tag
-                php_tag_end = content.find("?>")
-                if php_tag_end == -1:  # No closing tag
-                    lines = content.split('\n')
-                    if lines[0].strip() == "<?php":
-                        new_content = lines[0] + '\n\n' + about_statement + '\n'.join(lines[1:])
-                    else:
-                        new_content = about_statement + content
-                else:
-                    new_content = about_statement + content
-            else:
-                new_content = "<?php\n\n" + about_statement + content
-                
-        elif ext in ["*.html", "*.htm", "*.xml", "*.svg"]:
-            # Handle HTML/XML files - insert after declaration or at beginning
-            doctype_match = re.search(r'<!DOCTYPE[^>]*>|<\?xml[^>]*\?>', content, re.IGNORECASE)
-            if doctype_match:
-                insert_pos = doctype_match.end()
-                new_content = content[:insert_pos] + '\n\n' + about_statement + content[insert_pos:]
-            else:
-                new_content = about_statement + content
-                
-        elif ext == "*.py":
-            # Handle Python files - check for shebang or encoding
-            lines = content.split('\n')
-            insert_line = 0
+                logger.info(f"[*] Reading content of '{filepath}'")
             
-            # Skip shebang
-            if lines and lines[0].startswith('#!'):
-                insert_line = 1
-                
-            # Skip encoding declaration
-            if len(lines) > insert_line and 'coding' in lines[insert_line]:
-                insert_line += 1
-                
-            new_lines = lines[:insert_line] + [about_statement] + lines[insert_line:]
-            new_content = '\n'.join(new_lines)
+            # Check if about statement already exists; skipped files are never read in full
+            if not force and has_about_statement(head, filename):
+                if verbose:
+                    logger.warning(f"[!] About statement already exists in '{filepath}' (use -f to force overwrite)")
+                return "skipped"
             
-        else:
-            # Default: prepend to beginning
-            new_content = about_statement + content
-        
-        # Write the modified content back to file
-        try:
-            # Create backup if file is large or important
-            if filepath.stat().st_size > 10000:  # Files larger than 10KB
-                backup_path = filepath.with_suffix(filepath.suffix + '.bak')
+            # Generate about statement
+            about_statement = generate_about_statement(filepath, name, comment_style, stat_info)
+            
+            # Only the head is edited in memory, as bytes: every marker looked
+            # for is ASCII, so the file content is never decoded
+            
+            # CRLF files keep their line endings: the statement and its separators
+            # follow the first line's ending, while the file's own bytes are left
+            # untouched (a text-mode rewrite would leave LF on POSIX)
+            newline = b'\r\n' if head[:head.find(b'\n') + 1].endswith(b'\r\n') else b'\n'
+            if newline != b'\n':
+                about_statement = about_statement.replace(b'\n', newline)
+            
+            new_head = insert_about_statement(head, about_statement, newline, suffix)
+            
+            # The file is replaced rather than written in place, so its write
+            # protection has to be honoured explicitly
+            if not os.access(filepath, os.W_OK):
                 if verbose:
-                    print(f"[*] Creating backup: {backup_path}")
-                backup_path.write_text(content, encoding='utf-8', errors='ignore')
+                    logger.error(f"[!] File is not writable: {filepath}")
+                return "error"
             
-            with open(filepath, "w", encoding="utf-8") as file:
-                file.write(new_content)
+            # Write the modified content to a temporary copy
+            try:
+                # The rewrite is atomic, so backups are only made on request
+                if backup:
+                    backup_path = backup_file(filepath)
+                    if verbose:
+                        logger.info(f"[*] Created backup: {backup_path}")
                 
-            if verbose:
-                print(f"[*] Successfully added about statement to '{filepath}'")
-            else:
-                print(f"[✓] Processed: {filepath}")
-            return "processed"
-            
+                tmp_path = write_temp_file_with_head(filepath, new_head, src)
+                
+            except Exception as e:
+                if verbose:
+                    logger.error(f"[!] Error writing to file '{filepath}': {e}")
+                return "error"
+        
+        # Swap the copy in only after the original is closed
+        try:
+            replace_file(tmp_path, filepath, stat_info)
         except Exception as e:
             if verbose:
-                print(f"[!] Error writing to file '{filepath}': {e}")
+                logger.error(f"[!] Error writing to file '{filepath}': {e}")
             return "error"
+        
+        if verbose:
+            logger.info(f"[*] Successfully added about statement to '{filepath}'")
+        return "processed"
             
     except Exception as e:
         if verbose:
-            print(f"[!] Unexpected error processing '{filepath}': {e}")
+            logger.error(f"[!] Unexpected error processing '{filepath}': {e}")
         return "error"
 
 
@@ -627,61 +1068,74 @@ def main():
                        help="Show verbose output with detailed processing information")
     parser.add_argument("-f", "--force", action="store_true",
                        help="Force overwrite existing about statements")
+    parser.add_argument("-b", "--backup", action="store_true",
+                       help="Keep the original of each edited file as <file>.bak")
+    parser.add_argument("-j", "--jobs", type=int, default=MAX_WORKERS,
+                       help=f"Number of files edited in parallel (default: {MAX_WORKERS})")
     
     args = parser.parse_args()
+    setup_logging()
     
     # Validate inputs
     if not args.name.strip():
-        print("[!] Author name cannot be empty.")
+        logger.error("[!] Author name cannot be empty.")
+        return 1
+    
+    if args.jobs < 1:
+        logger.error("[!] Number of jobs must be at least 1.")
         return 1
         
     path = pathlib.Path(args.path).resolve()
     
     if not path.exists():
-        print(f"[!] Path '{args.path}' does not exist.")
+        logger.error(f"[!] Path '{args.path}' does not exist.")
         return 1
     
-    # Clear the files list for fresh run
-    FILES_LIST.clear()
-    
     if path.is_dir():
         # Process directory
         exts = ["*"] if not args.exts else [ext.strip() for ext in args.exts.split(",")]
         
         if args.verbose:
-            print(f"[*] Processing directory: {path}")
-            print(f"[*] Extensions filter: {exts}")
-            print(f"[*] Author: {args.name}")
-            print(f"[*] Force overwrite: {args.force}")
-            print("-" * 50)
+            logger.info(f"[*] Processing directory: {path}\n"
+                        f"[*] Extensions filter: {exts}\n"
+                        f"[*] Author: {args.name}\n"
+                        f"[*] Force overwrite: {args.force}\n"
+                        f"[*] Backup: {args.backup}\n"
+                        f"[*] Jobs: {args.jobs}\n"
+                        f"{'-' * 50}")
         
-        get_folder(str(path), exts, args.verbose)
+        # Nothing can match, so don't walk the tree at all
+        if not accepted_suffixes(exts):
+            logger.error(f"[!] None of the extensions {exts} are supported.")
+            return 1
+        
+        # Files are edited as the walk discovers them
+        files = get_folder(str(path), exts, args.verbose)
         
-        if not FILES_LIST:
-            print(f"[!] No supported files found in '{path}' with extensions {exts}")
+        if not perm_edit(files, args.name, args.force, args.verbose, args.backup, args.jobs):
+            logger.error(f"[!] No supported files found in '{path}' with extensions {exts}")
             return 1
-            
-        perm_edit(args.name, args.force, args.verbose)
         
     elif path.is_file():
         # Process single file
         if args.verbose:
-            print(f"[*] Processing single file: {path}")
-            print(f"[*] Author: {args.name}")
-            print(f"[*] Force overwrite: {args.force}")
-            print("-" * 50)
+            logger.info(f"[*] Processing single file: {path}\n"
+                        f"[*] Author: {args.name}\n"
+                        f"[*] Force overwrite: {args.force}\n"
+                        f"[*] Backup: {args.backup}\n"
+                        f"{'-' * 50}")
         
-        result = edit_file(path, args.name, args.force, args.verbose)
+        result = edit_file(path, args.name, args.force, args.verbose, backup=args.backup)
         
         if result == "processed":
-            print(f"[✓] Successfully processed: {path}")
+            logger.info(f"[✓] Successfully processed: {path}")
         elif result == "skipped":
-            print(f"[!] Skipped (already has about statement): {path}")
+            logger.warning(f"[!] Skipped (already has about statement): {path}")
         else:
-            print(f"[!] Failed to process: {path}")
+            logger.error(f"[!] Failed to process: {path}")
             return 1
     else:
-        print(f"[!] '{args.path}' is neither a file nor a directory.")
+        logger.error(f"[!] '{args.path}' is neither a file nor a directory.")
         return 1
     
     return 0
@@ -692,8 +1146,8 @@ if __name__ == "__main__":
         exit_code = main()
         exit(exit_code)
     except KeyboardInterrupt:
-        print("\n[!] Operation cancelled by user.")
+        logger.warning("\n[!] Operation cancelled by user.")
         exit(130)
     except Exception as e:
-        print(f"[!] Unexpected error: {e}")
+        logger.error(f"[!] Unexpected error: {e}")
         exit(1)